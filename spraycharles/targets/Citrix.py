@@ -1,5 +1,3 @@
-import requests
-
 from .classes.BaseHttpTarget import BaseHttpTarget
 
 ##############################
@@ -24,7 +22,6 @@ class Citrix(BaseHttpTarget):
             "Accept-Language": "en-US,en;q=0.5",
             "Accept-Encoding": "gzip, deflate",
             # 'Referer': 'https://%s/vpn/index.html' % (host),
-            "Connection": "close",
             "Upgrade-Insecure-Requests": "1",
             "Content-Type": "application/x-www-form-urlencoded",
         }
@@ -56,7 +53,7 @@ class Citrix(BaseHttpTarget):
         self.set_username(username)
         self.set_password(password)
         # post the request
-        response = requests.post(
+        response = self.session.post(
             self.url,
             headers=self.headers,
             data=self.data,
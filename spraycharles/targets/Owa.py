@@ -1,5 +1,3 @@
-import requests
-
 from .classes.BaseHttpTarget import BaseHttpTarget
 
 
@@ -21,7 +19,6 @@ class Owa(BaseHttpTarget):
             "Accept-Language": "en-US,en;q=0.5",
             "Accept-Encoding": "gzip, deflate",
             "Referer": f"https://{host}/owa/auth/logon.aspx?replaceCurrent=1",
-            "Connection": "close",
             "Upgrade-Insecure-Requests": "1",
             "Content-Type": "application/x-www-form-urlencoded",
         }
@@ -62,7 +59,7 @@ class Owa(BaseHttpTarget):
         self.set_username(username)
         self.set_password(password)
         # post the request
-        response = requests.post(
+        response = self.session.post(
             self.url,
             headers=self.headers,
             cookies=self.cookies,
@@ -13,7 +13,11 @@ class Smb:
     # formatting and logic from main spraycharles.py consistent with HTTP modules
     def __init__(self, host, port, timeout, fireprox):
         self.host = host
+        # address to connect to, replaced with the resolved ip by spraycharles
+        self.ip = host
         self.url = f"smb://{host}"
+        # connection reused across login attempts, opened on first use
+        self.login_conn = None
         conn = ""
         domain = ""
         hostname = ""
@@ -26,14 +30,14 @@ class Smb:
         # Try connecting with SMBv1 first
         try:
             self.conn = SMBConnection(
-                self.host, self.host, None, 445, preferredDialect=SMB_DIALECT
+                self.host, self.ip, None, 445, preferredDialect=SMB_DIALECT
             )
         except Exception as e:
             # print(e)
             self.smbv1 = False
             # v1 failed, try with v3
             try:
-                self.conn = SMBConnection(self.host, self.host, None, 445)
+                self.conn = SMBConnection(self.host, self.ip, None, 445)
             except Exception as e:
                 # print(e)
                 # failed to get smb connection
@@ -61,33 +65,55 @@ class Smb:
             domain = username.split("\\")[0]
             username = username.split("\\")[1]
 
-        # get new smb connection
+        # reuse the smb connection between attempts. one the server dropped while
+        # idle (e.g. during the interval wait) is replaced and the login tried again
+        for retry in range(2):
+            try:
+                if self.login_conn is None:
+                    self.login_conn = self._connect()
+                self.login_conn.login(username, self.password, domain)
+                self.login_conn.logoff()
+                return "STATUS_SUCCESS"
+            except SessionError as e:
+                # smbv1 clears its uid after a failed login, but smb2/3 keeps the
+                # failed session id on the connection, so start those over
+                if not self.smbv1:
+                    self._close_conn()
+                return self._login_status(e)
+            except Exception:
+                self._close_conn()
+                if retry:
+                    raise
+
+    def _close_conn(self):
+        try:
+            self.login_conn.close()
+        except Exception:
+            # the connection may already be gone
+            pass
+        self.login_conn = None
+
+    def _connect(self):
         if self.smbv1:
-            self.conn = SMBConnection(
-                self.host, self.host, None, 445, preferredDialect=SMB_DIALECT
+            return SMBConnection(
+                self.host, self.ip, None, 445, preferredDialect=SMB_DIALECT
             )
+        return SMBConnection(self.host, self.ip, None, 445)
+
+    def _login_status(self, e):
+        if "STATUS_LOGON_FAILURE" in str(e):
+            return "STATUS_LOGON_FAILURE"
+        elif "STATUS_ACCOUNT_LOCKED_OUT" in str(e):
+            return "STATUS_ACCOUNT_LOCKED_OUT"
+        elif "STATUS_ACCOUNT_DISABLED" in str(e):
+            return "STATUS_ACCOUNT_DISABLED"
+        elif "STATUS_PASSWORD_EXPIRED" in str(e):
+            return "STATUS_PASSWORD_EXPIRED"
+        elif "STATUS_PASSWORD_MUST_CHANGE" in str(e):
+            return "STATUS_PASSWORD_MUST_CHANGE"
         else:
-            self.conn = SMBConnection(self.host, self.host, None, 445)
-
-        # login
-        try:
-            self.conn.login(username, self.password, domain)
-            self.conn.logoff()
-            return "STATUS_SUCCESS"
-        except SessionError as e:
-            if "STATUS_LOGON_FAILURE" in str(e):
-                return "STATUS_LOGON_FAILURE"
-            elif "STATUS_ACCOUNT_LOCKED_OUT" in str(e):
-                return "STATUS_ACCOUNT_LOCKED_OUT"
-            elif "STATUS_ACCOUNT_DISABLED" in str(e):
-                return "STATUS_ACCOUNT_DISABLED"
-            elif "STATUS_PASSWORD_EXPIRED" in str(e):
-                return "STATUS_PASSWORD_EXPIRED"
-            elif "STATUS_PASSWORD_MUST_CHANGE" in str(e):
-                return "STATUS_PASSWORD_MUST_CHANGE"
-            else:
-                # something funky happened
-                return str(e)
+            # something funky happened
+            return str(e)
 
     # handle CSV out output headers. Can be customized per module
     def print_headers(self, csvfile):
@@ -103,11 +129,9 @@ class Smb:
         output.close()
 
     # handle target's response evaluation. Can be customized per module
-    def print_response(self, response, csvfile, timeout=False):
+    def print_response(self, response, output, timeout=False):
         # print result to screen
         print("%-25s %-17s %-23s" % (self.username, self.password, response))
 
         # print to CSV file
-        output = open(csvfile, "a")
         output.write(f"{self.username},{self.password},{response}\n")
-        output.close()
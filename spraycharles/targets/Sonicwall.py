@@ -1,5 +1,3 @@
-import requests
-
 from .classes.BaseHttpTarget import BaseHttpTarget
 
 
@@ -23,7 +21,6 @@ class Sonicwall(BaseHttpTarget):
             "Accept-Encoding": "gzip, deflate",
             "Referer": f"https://{host}:{port}/sslvpnLogin.html",
             "Content-Type": "application/x-www-form-urlencoded",
-            "Connection": "close",
             "Upgrade-Insecure-Requests": "1",
         }
         self.data = {
@@ -61,7 +58,7 @@ class Sonicwall(BaseHttpTarget):
         self.set_username(username)
         self.set_password(password)
         # post the request
-        response = requests.post(
+        response = self.session.post(
             self.url,
             headers=self.headers,
             cookies=self.cookies,
@@ -1,7 +1,14 @@
 import glob
+from importlib import import_module
 from os.path import basename, dirname, isfile
 
 modules = glob.glob(dirname(__file__) + "/*.py")
 __all__ = [
     basename(f)[:-3] for f in modules if isfile(f) and not f.endswith("__init__.py")
 ]
+
+# spray target classes keyed by lowercase module name
+TARGETS = {
+    name.lower(): getattr(import_module(f".{name}", __name__), name)
+    for name in sorted(__all__)
+}
@@ -28,7 +28,7 @@ class BaseHttpTarget:
         output_writer.writeheader()
         output.close()
 
-    def print_response(self, response, csvfile, timeout=False):
+    def print_response(self, response, output, timeout=False):
         """
         Handle target's response evaluation. Can be overridden per module
         """
@@ -43,6 +43,4 @@ class BaseHttpTarget:
         print("%-35s %-17s %13s %15s" % (self.username, self.password, code, length))
 
         # print to CSV file
-        output = open(csvfile, "a")
         output.write(f"{self.username},{self.password},{code},{length}\n")
-        output.close()
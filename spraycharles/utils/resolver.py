@@ -0,0 +1,66 @@
+import socket
+import time
+
+import urllib3.util.connection
+
+# seconds a resolved address is used before the host is looked up again
+PIN_TTL = 300
+
+# hostnames mapped to the address resolved for them and when it was resolved
+pinned_hosts = {}
+
+_create_connection = urllib3.util.connection.create_connection
+
+
+def _resolve(host):
+    ip = socket.gethostbyname(host)
+    pinned_hosts[host] = (ip, time.monotonic())
+    return ip
+
+
+# TLS SNI and the Host header are built from the hostname, only the socket
+# connects to the pinned address
+def _pinned_create_connection(address, *args, **kwargs):
+    host, port = address
+    if host not in pinned_hosts:
+        return _create_connection(address, *args, **kwargs)
+
+    ip, resolved = pinned_hosts[host]
+    if resolved is None or time.monotonic() - resolved >= PIN_TTL:
+        try:
+            ip = _resolve(host)
+        except OSError:
+            # stop pinning a host that can't be resolved
+            pinned_hosts.pop(host, None)
+            raise
+
+    try:
+        return _create_connection((ip, port), *args, **kwargs)
+    except OSError:
+        # the pinned address may have rotated out, so look the host up again on
+        # the next connection. retrying is left to the caller
+        pinned_hosts[host] = (ip, None)
+        raise
+
+
+def pin_host(host):
+    """
+    Resolve host and have urllib3 connect to that address, refreshing it every
+    PIN_TTL seconds or after a failed connection
+    """
+    try:
+        ip = _resolve(host)
+    except socket.gaierror:
+        # leave resolution (and reporting the failure) to the connection itself
+        return None
+
+    urllib3.util.connection.create_connection = _pinned_create_connection
+    return ip
+
+
+def unpin_hosts():
+    """
+    Drop all pinned hosts and restore urllib3's own create_connection
+    """
+    pinned_hosts.clear()
+    urllib3.util.connection.create_connection = _create_connection
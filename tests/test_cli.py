@@ -9,5 +9,5 @@ def test_cli():
     runner = CliRunner()
 
     # No such option
-    result = runner.invoke(sc.main, ["-x", "test"])
+    result = runner.invoke(sc.cli, ["-x", "test"])
     assert "No such option" in result.output
@@ -0,0 +1,88 @@
+import socket
+
+import pytest
+import urllib3.util.connection
+
+from spraycharles.utils import resolver
+
+
+@pytest.fixture
+def lookups(monkeypatch):
+    # answer lookups with the next address in the list, counting each one
+    answers = ["10.0.0.1", "10.0.0.2", "10.0.0.3"]
+    calls = []
+
+    def gethostbyname(host):
+        calls.append(host)
+        return answers[len(calls) - 1]
+
+    monkeypatch.setattr(resolver.socket, "gethostbyname", gethostbyname)
+
+    # restore urllib3's own function once the test is done with the fakes
+    create_connection = urllib3.util.connection.create_connection
+    monkeypatch.setattr(urllib3.util.connection, "create_connection", create_connection)
+    yield calls
+    resolver.unpin_hosts()
+
+
+@pytest.fixture
+def connections(monkeypatch):
+    # record the address each connection is made to, failing on request
+    connected = []
+    failing = set()
+
+    def create_connection(address, *args, **kwargs):
+        connected.append(address)
+        if address[0] in failing:
+            raise socket.timeout()
+        return address
+
+    monkeypatch.setattr(resolver, "_create_connection", create_connection)
+    return connected, failing
+
+
+def test_pin_host(lookups, connections):
+    connected, _ = connections
+
+    assert resolver.pin_host("mail.example.com") == "10.0.0.1"
+    assert urllib3.util.connection.create_connection is (
+        resolver._pinned_create_connection
+    )
+
+    # pinned hosts connect to the resolved address, others are left alone
+    urllib3.util.connection.create_connection(("mail.example.com", 443))
+    urllib3.util.connection.create_connection(("other.example.com", 443))
+    assert connected == [("10.0.0.1", 443), ("other.example.com", 443)]
+    assert lookups == ["mail.example.com"]
+
+    resolver.unpin_hosts()
+    assert resolver.pinned_hosts == {}
+    assert urllib3.util.connection.create_connection is resolver._create_connection
+
+
+def test_pin_expires(lookups, connections):
+    connected, _ = connections
+
+    resolver.pin_host("mail.example.com")
+    ip, resolved = resolver.pinned_hosts["mail.example.com"]
+    resolver.pinned_hosts["mail.example.com"] = (ip, resolved - resolver.PIN_TTL)
+    resolver._pinned_create_connection(("mail.example.com", 443))
+
+    assert lookups == ["mail.example.com", "mail.example.com"]
+    assert connected == [("10.0.0.2", 443)]
+
+
+def test_failed_connection(lookups, connections):
+    connected, failing = connections
+    failing.add("10.0.0.1")
+
+    # a failed connection isn't retried, but the next one looks the host up again
+    resolver.pin_host("mail.example.com")
+    with pytest.raises(socket.timeout):
+        resolver._pinned_create_connection(("mail.example.com", 443))
+    assert connected == [("10.0.0.1", 443)]
+    assert len(lookups) == 1
+
+    resolver._pinned_create_connection(("mail.example.com", 443))
+    assert connected == [("10.0.0.1", 443), ("10.0.0.2", 443)]
+    assert len(lookups) == 2
@@ -0,0 +1,264 @@
+import asyncio
+import os
+
+import pytest
+
+from spraycharles import spraycharles as sc
+
+
+def make_spraycharles(tmp_path, monkeypatch, usernames, passwords, **kwargs):
+    monkeypatch.setenv("HOME", str(tmp_path))
+
+    user_file = tmp_path / "users.txt"
+    user_file.write_text("\n".join(usernames) + "\n")
+
+    args = dict(
+        passwords=passwords,
+        users=str(user_file),
+        host="mail.example.com",
+        module="owa",
+        path=None,
+        output=str(tmp_path / "out.csv"),
+        attempts=None,
+        interval=None,
+        equal=False,
+        timeout=5,
+        port=443,
+        fireprox=None,
+        domain=None,
+        analyze=False,
+        jitter=None,
+        jitter_min=None,
+        notify=None,
+        webhook=None,
+        pause=False,
+        concurrency=1,
+    )
+    args.update(kwargs)
+    return sc.Spraycharles(**args)
+
+
+def test_check_file_contents(tmp_path, monkeypatch):
+    spraycharles = make_spraycharles(tmp_path, monkeypatch, ["alice"], "Password1")
+    user_file = tmp_path / "users.txt"
+
+    # first check records the mtime and only returns lines not already loaded
+    user_file.write_text("alice\nbob\nbob\n\ncarol\n")
+    assert spraycharles._check_file_contents(
+        str(user_file), spraycharles._user_set, "_user_mtime"
+    ) == ["bob", "carol"]
+    assert spraycharles._user_set == {b"alice", b"bob", b"carol"}
+
+    # unchanged mtime skips reading the file
+    mtime = spraycharles._user_mtime
+    user_file.write_text("alice\nbob\ncarol\ndave\n")
+    os.utime(user_file, (mtime, mtime))
+    assert (
+        spraycharles._check_file_contents(
+            str(user_file), spraycharles._user_set, "_user_mtime"
+        )
+        == []
+    )
+
+    # missing file returns nothing
+    assert (
+        spraycharles._check_file_contents(
+            str(tmp_path / "missing.txt"), spraycharles._user_set, "_user_mtime"
+        )
+        == []
+    )
+
+
+def test_check_file_contents_undecodable(tmp_path, monkeypatch):
+    monkeypatch.setattr(sc, "LIST_ENCODING", "utf-8")
+    spraycharles = make_spraycharles(tmp_path, monkeypatch, ["alice"], "Password1")
+    user_file = tmp_path / "users.txt"
+
+    user_file.write_bytes(b"alice\n\xff\xfe\ndave\n")
+    assert spraycharles._check_file_contents(
+        str(user_file), spraycharles._user_set, "_user_mtime"
+    ) == ["dave"]
+    assert spraycharles._user_set == {b"alice", b"dave"}
+    assert spraycharles._user_mtime == os.stat(user_file).st_mtime
+
+
+def test_undecodable_password_arg(tmp_path, monkeypatch):
+    monkeypatch.setattr(sc, "LIST_ENCODING", "utf-8")
+    password_file = tmp_path / "passwords.txt"
+    password_file.write_bytes(b"\xff\xfe\n")
+
+    # a list that can't be decoded falls back to a single password
+    spraycharles = make_spraycharles(
+        tmp_path, monkeypatch, ["alice"], str(password_file)
+    )
+    assert spraycharles.passwords == [str(password_file)]
+
+
+def test_undecodable_user_file(tmp_path, monkeypatch):
+    monkeypatch.setattr(sc, "LIST_ENCODING", "utf-8")
+    bad_file = tmp_path / "bad.txt"
+    bad_file.write_bytes(b"alice\n\xff\xfe\n")
+
+    with pytest.raises(SystemExit):
+        make_spraycharles(tmp_path, monkeypatch, [], "Password1", users=str(bad_file))
+
+
+class DroppedTarget:
+    def __init__(self, stop):
+        self.stop = stop
+        self.calls = 0
+
+    def login(self, username, password):
+        # interrupt the spray while the connection is failing
+        self.calls += 1
+        self.stop.set()
+        raise sc.requests.ConnectionError()
+
+
+def test_login_stops_retrying(tmp_path, monkeypatch):
+    spraycharles = make_spraycharles(tmp_path, monkeypatch, ["alice"], "Password1")
+    target = DroppedTarget(spraycharles._stop)
+
+    spraycharles._login(target, "alice", "Password1")
+    assert target.calls == 1
+
+    # no new attempts are started once the spray is stopped
+    spraycharles._login(target, "alice", "Password1")
+    assert target.calls == 1
+
+
+def test_clone_target():
+    target = sc.TARGETS["owa"]("mail.example.com", 443, 5, None)
+
+    clone = sc._clone_target(target)
+    assert clone is not target
+    assert clone.data == target.data and clone.data is not target.data
+    assert clone.headers == target.headers and clone.headers is not target.headers
+
+    clone.data["username"] = "alice"
+    assert target.data.get("username") != "alice"
+
+
+class RecordingTarget:
+    def __init__(self):
+        self.attempts = []
+
+    def login(self, username, password):
+        self.attempts.append((username, password))
+        return None
+
+    def print_response(self, response, output, timeout=False):
+        pass
+
+
+class FakeAnalyzer:
+    hit_users = set()
+
+    def __init__(self, output, notify, webhook, host, total_hits):
+        self.hit_users = set(FakeAnalyzer.hit_users)
+
+    def analyze(self):
+        return len(self.hit_users)
+
+
+def run_spray(spraycharles, monkeypatch, hit_users=()):
+    monkeypatch.setattr(sc, "Analyzer", FakeAnalyzer)
+    monkeypatch.setattr(FakeAnalyzer, "hit_users", set(hit_users))
+
+    spraycharles.target = RecordingTarget()
+    spraycharles._output_file = open(spraycharles.output, "a")
+
+    # skip the wait between batches
+    spraycharles.interval = 0
+    asyncio.run(spraycharles._spray())
+    return spraycharles.target.attempts
+
+
+def test_lists_deduplicated(tmp_path, monkeypatch):
+    password_file = tmp_path / "passwords.txt"
+    password_file.write_text("Password1\nPassword2\nPassword1\n")
+
+    spraycharles = make_spraycharles(
+        tmp_path,
+        monkeypatch,
+        ["alice", "bob", "alice"],
+        str(password_file),
+        attempts=1,
+        interval=1,
+    )
+    assert spraycharles.usernames == ["alice", "bob"]
+    assert spraycharles.passwords == ["Password1", "Password2"]
+    assert spraycharles._user_set == {b"alice", b"bob"}
+    assert spraycharles._password_set == {b"Password1", b"Password2"}
+
+
+def test_spray_reloads_lists(tmp_path, monkeypatch):
+    password_file = tmp_path / "passwords.txt"
+    password_file.write_text("Password1\n")
+
+    spraycharles = make_spraycharles(
+        tmp_path, monkeypatch, ["alice"], str(password_file), domain="CORP"
+    )
+
+    # entries added after the spray started are picked up by the next pass
+    (tmp_path / "users.txt").write_text("alice\nbob\n")
+    password_file.write_text("Password1\nPassword2\n")
+
+    attempts = run_spray(spraycharles, monkeypatch)
+    assert sorted(attempts) == [
+        ("CORP\\alice", "Password1"),
+        ("CORP\\alice", "Password2"),
+        ("CORP\\bob", "Password1"),
+        ("CORP\\bob", "Password2"),
+    ]
+
+
+def test_spray_skips_hit_users(tmp_path, monkeypatch):
+    password_file = tmp_path / "passwords.txt"
+    password_file.write_text("Password1\nPassword2\n")
+
+    spraycharles = make_spraycharles(
+        tmp_path,
+        monkeypatch,
+        ["alice", "bob"],
+        str(password_file),
+        attempts=1,
+        interval=1,
+        domain="CORP",
+        analyze=True,
+    )
+
+    # results hold the submitted username, so hits come back domain prefixed
+    attempts = run_spray(spraycharles, monkeypatch, hit_users={"CORP\\alice"})
+    assert spraycharles._succeeded == {"alice"}
+    assert sorted(attempts) == [
+        ("CORP\\alice", "Password1"),
+        ("CORP\\bob", "Password1"),
+        ("CORP\\bob", "Password2"),
+    ]
+
+
+def test_spray_skips_equal_pairs(tmp_path, monkeypatch):
+    password_file = tmp_path / "passwords.txt"
+    password_file.write_text("alice\nPassword1\n")
+
+    spraycharles = make_spraycharles(
+        tmp_path,
+        monkeypatch,
+        ["alice", "bob"],
+        str(password_file),
+        attempts=3,
+        interval=1,
+        equal=True,
+        domain="CORP",
+    )
+
+    # alice:alice was already sprayed by -e, so the "alice" pass only tries bob
+    attempts = run_spray(spraycharles, monkeypatch)
+    assert sorted(attempts) == [
+        ("CORP\\alice", "Password1"),
+        ("CORP\\bob", "Password1"),
+        ("CORP\\bob", "alice"),
+        ("alice", "alice"),
+        ("bob", "bob"),
+    ]